@@ -43,10 +43,11 @@ else
     MISSING_DEPS+=("portaudio19-dev")
 fi
 
+# xclip is optional: the app only falls back to it when GTK has no display
 if command -v xclip >/dev/null 2>&1; then
     echo "  ✓ xclip installed"
 else
-    MISSING_DEPS+=("xclip")
+    echo "  - xclip not installed (optional, used only without a display)"
 fi
 
 if [ ${#MISSING_DEPS[@]} -ne 0 ]; then
@@ -54,13 +55,13 @@ if [ ${#MISSING_DEPS[@]} -ne 0 ]; then
     echo -e "${RED}Missing system dependencies: ${MISSING_DEPS[*]}${NC}"
     echo ""
     echo "Please install them with:"
-    echo -e "${YELLOW}sudo apt install python3-gi python3-gi-cairo gir1.2-gtk-3.0 gir1.2-appindicator3-0.1 xclip portaudio19-dev${NC}"
+    echo -e "${YELLOW}sudo apt install python3-gi python3-gi-cairo gir1.2-gtk-3.0 gir1.2-appindicator3-0.1 portaudio19-dev${NC}"
     echo ""
     read -p "Do you want to install them now? [y/N] " -n 1 -r
     echo
     if [[ $REPLY =~ ^[Yy]$ ]]; then
         sudo apt update
-        sudo apt install -y python3-gi python3-gi-cairo gir1.2-gtk-3.0 gir1.2-appindicator3-0.1 xclip portaudio19-dev
+        sudo apt install -y python3-gi python3-gi-cairo gir1.2-gtk-3.0 gir1.2-appindicator3-0.1 portaudio19-dev
         echo -e "${GREEN}✓ System dependencies installed${NC}"
     else
         echo -e "${RED}Cannot proceed without system dependencies. Exiting.${NC}"
@@ -92,7 +93,7 @@ echo -e "${GREEN}✓ pip upgraded${NC}"
 
 echo ""
 echo -e "${YELLOW}[5/5] Installing Python dependencies...${NC}"
-pip install groq pyaudio PyGObject-stubs -q
+pip install groq 'httpx[http2]' pyaudio PyGObject-stubs 'audioop-lts; python_version >= "3.13"' -q
 echo -e "${GREEN}✓ Python dependencies installed${NC}"
 
 echo ""
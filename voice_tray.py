@@ -4,7 +4,7 @@ Voice-to-Text System Tray Application
 Signal-activated voice recording with visual feedback
 
 sudo apt install python3-gi python3-gi-cairo gir1.2-gtk-3.0 gir1.2-appindicator3-0.1 xdotool xclip portaudio19-dev
-pip install groq pyaudio PyGObject-stubs
+pip install groq 'httpx[http2]' pyaudio PyGObject-stubs  # plus audioop-lts on Python 3.13+
 
 Send SIGUSR1 signal to toggle recording (bind to any hotkey in system settings)
 """
@@ -32,30 +32,45 @@ def suppress_stderr():
 
 import pyaudio
 import wave
-import tempfile
-from groq import Groq
+import struct
+import io
+import asyncio
+import bisect
+import collections
+import itertools
+import queue
 import subprocess
 from threading import Thread, Event
 import signal
+import time
 import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('AppIndicator3', '0.1')
-from gi.repository import Gtk, AppIndicator3, GLib
-import array
+from gi.repository import Gtk, Gdk, AppIndicator3, GLib
+import audioop  # Removed from the stdlib in Python 3.13; provided there by audioop-lts
 
 
 class AudioRecorder:
     """Audio recording with level monitoring"""
 
     # Audio configuration constants
-    CHUNK = 1024
+    CHUNK = 512  # Initial buffer size (32 ms), doubled after overflows
+    MAX_CHUNK = 2048
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
     RATE = 16000
+    SAMPLE_WIDTH = 2  # Bytes per sample for paInt16
     NORMALIZATION_DIVISOR = 3276.70  # For 16-bit audio: 32767 / 10
 
     def __init__(self, device_index=None):
         self.device_index = device_index
+        self.chunk = self.CHUNK
+
+        # Every recording reuses (and truncates) the same file, private to the user
+        cache_dir = os.path.expanduser("~/.cache/voice_to_text")
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        os.chmod(cache_dir, 0o700)
+        self._rec_path = os.path.join(cache_dir, "rec.wav")
         
         with suppress_stderr():
             self.audio = pyaudio.PyAudio()
@@ -78,11 +93,39 @@ class AudioRecorder:
                     continue
         return None
     
-    def record(self, stop_event, level_callback=None):
-        """Record audio until stop_event is set"""
+    def record(self, stop_event, level_callback=None, chunk_callback=None):
+        """Record audio until stop_event is set
+
+        level_callback receives the level of every chunk and chunk_callback
+        the raw chunk itself; both are called from the recording thread.
+        """
         if self.device_index is None:
             return None
         
+        # PortAudio's own thread deposits chunks here; this thread drains them.
+        # The state is local so an overlapping record() call cannot share it.
+        chunks = collections.deque()
+        overflows = 0
+        priority_set = False
+        reported_overflows = 0
+
+        def on_audio(in_data, _frame_count, _time_info, status):
+            """Queue a captured chunk (runs in PortAudio's callback thread)"""
+            nonlocal overflows, priority_set
+            if not priority_set:
+                priority_set = True
+                # Realtime priority for the capture thread; needs CAP_SYS_NICE
+                try:
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+                except (OSError, AttributeError):
+                    pass
+
+            if status & pyaudio.paInputOverflow:
+                overflows += 1
+
+            chunks.append(in_data)
+            return (None, pyaudio.paContinue)
+
         with suppress_stderr():
             stream = self.audio.open(
                 format=self.FORMAT,
@@ -90,48 +133,204 @@ class AudioRecorder:
                 rate=self.RATE,
                 input=True,
                 input_device_index=self.device_index,
-                frames_per_buffer=self.CHUNK
+                frames_per_buffer=self.chunk,
+                stream_callback=on_audio
             )
         
-        frames = []
+        # Stream raw PCM straight into the output file behind a placeholder header
+        fd = os.open(self._rec_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # O_CREAT's mode only applies to new files; tighten one left by older versions
+        os.fchmod(fd, 0o600)
+        os.write(fd, self._wav_header(0))
+
+        data_size = 0
         
-        while not stop_event.is_set():
-            try:
-                data = stream.read(self.CHUNK, exception_on_overflow=False)
-                frames.append(data)
-                
-                # Calculate audio level for visual feedback
-                if level_callback:
-                    audio_data = array.array('h', data)
-                    if len(audio_data) > 0:
-                        level = max(abs(min(audio_data)), abs(max(audio_data)))
+        try:
+            stopped = False
+            while not stopped:
+                # Sleep until roughly one chunk has arrived, or recording stops
+                stopped = stop_event.wait(self.chunk / self.RATE)
+                if stopped:
+                    # Stop capture first so the final drain collects everything
+                    stream.stop_stream()
+
+                # Overflows lose samples but never end the recording
+                if overflows != reported_overflows:
+                    print(f"[DEBUG] Input overflow ({overflows} so far, buffer {self.chunk})")
+                    reported_overflows = overflows
+
+                while chunks:
+                    data = chunks.popleft()
+                    os.write(fd, data)
+                    data_size += len(data)
+
+                    if chunk_callback:
+                        chunk_callback(data)
+                    
+                    # Calculate audio level for visual feedback
+                    if level_callback and data:
+                        level = audioop.max(data, self.SAMPLE_WIDTH)
                         normalized_level = int((level / self.NORMALIZATION_DIVISOR) * 100)
-                        GLib.idle_add(level_callback, normalized_level)
-            except:
-                break
-        
-        stream.stop_stream()
-        stream.close()
+                        level_callback(normalized_level)
+        except Exception as e:
+            print(f"Recording error: {e}")
+        finally:
+            stream.stop_stream()
+            stream.close()
+            # Rewrite the header with the final sizes, so the file stays valid on errors
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, self._wav_header(data_size))
+            os.close(fd)
+
+        # Trade latency for headroom on the next recording if this one overran
+        if overflows and self.chunk < self.MAX_CHUNK:
+            self.chunk *= 2
+            print(f"[DEBUG] Audio buffer increased to {self.chunk} frames")
         
-        if not frames:
+        if not data_size:
             return None
         
-        # Save to temporary file
-        tmp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        wf = wave.open(tmp_file.name, 'wb')
-        wf.setnchannels(self.CHANNELS)
-        wf.setsampwidth(self.audio.get_sample_size(self.FORMAT))
-        wf.setframerate(self.RATE)
-        wf.writeframes(b''.join(frames))
-        wf.close()
-        
-        return tmp_file.name
+        return self._rec_path
     
+    def _wav_header(self, data_size):
+        """Build the 44-byte PCM WAV header for data_size bytes of samples"""
+        block_align = self.CHANNELS * self.SAMPLE_WIDTH
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, self.CHANNELS, self.RATE, self.RATE * block_align,
+            block_align, self.SAMPLE_WIDTH * 8,
+            b'data', data_size
+        )
+
     def cleanup(self):
         """Cleanup audio resources"""
         self.audio.terminate()
 
 
+class StreamingTranscriber:
+    """Transcribes a recording in overlapping windows while it is captured"""
+
+    # Window layout: each upload shares OVERLAP_SECONDS with the previous one
+    WINDOW_SECONDS = 5
+    OVERLAP_SECONDS = 0.5
+    MAX_CONCURRENT_REQUESTS = 4
+    MAX_OVERLAP_WORDS = 10  # Longest repeated phrase removed when merging
+
+    def __init__(self, transcribe, loop, rate, sample_width, channels, silence_peak=0):
+        """transcribe(name, content) is a coroutine returning one window's text
+
+        Windows whose peak sample stays below silence_peak are not uploaded.
+        """
+        self.transcribe = transcribe
+        self.loop = loop
+        self.silence_peak = silence_peak
+        self.rate = rate
+        self.sample_width = sample_width
+        self.channels = channels
+
+        frame_size = sample_width * channels
+        self._window_bytes = int(self.WINDOW_SECONDS * rate) * frame_size
+        self._overlap_bytes = int(self.OVERLAP_SECONDS * rate) * frame_size
+
+        self._queue = queue.Queue()
+        self._semaphore = None  # Created on the event loop by the first upload
+        self._futures = []  # Indexed by chunk id
+        self._tail = b''
+
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def feed(self, data):
+        """Queue a recorded chunk (called from the recording thread)"""
+        self._queue.put(data)
+
+    def close(self):
+        """Stop accepting audio and upload the remaining tail
+
+        Returns False if no window was uploaded, in which case the caller
+        should transcribe the whole file in a single request.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+        if not self._futures:
+            return False
+
+        # The tail always repeats the previous overlap, so skip it if that is all it holds
+        if len(self._tail) > self._overlap_bytes:
+            self._submit(self._tail)
+        return True
+
+    async def text(self):
+        """Wait for every window and return the merged transcription"""
+        results = await asyncio.gather(*(asyncio.wrap_future(f) for f in self._futures))
+
+        text = ""
+        for result in results:
+            text = self._merge_overlap(text, result.strip())
+        return text
+
+    def _run(self):
+        """Cut queued audio into overlapping windows (runs in background thread)"""
+        buf = bytearray()
+        span = self._window_bytes + self._overlap_bytes
+
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+
+            buf.extend(data)
+            if len(buf) >= span:
+                self._submit(bytes(buf[:span]))
+                del buf[:self._window_bytes]
+
+        self._tail = bytes(buf)
+
+    def _submit(self, pcm):
+        """Schedule one window upload on the event loop"""
+        # Whisper tends to answer silence with the prompt or a stock phrase
+        if audioop.max(pcm, self.sample_width) < self.silence_peak:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self._upload(pcm), self.loop)
+        self._futures.append(future)
+
+    async def _upload(self, pcm):
+        """Transcribe one window, limiting concurrent requests"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async with self._semaphore:
+            return await self.transcribe("chunk.wav", self._to_wav(pcm))
+
+    def _to_wav(self, pcm):
+        """Encode raw PCM as an in-memory WAV file"""
+        buf = io.BytesIO()
+        with wave.open(buf, 'wb') as wf:
+            wf.setnchannels(self.channels)
+            wf.setsampwidth(self.sample_width)
+            wf.setframerate(self.rate)
+            wf.writeframes(pcm)
+        return buf.getvalue()
+
+    def _merge_overlap(self, left, right):
+        """Join two window texts, dropping the words both heard in the overlap"""
+        left_words = left.split()
+        right_words = right.split()
+
+        def normalize(words):
+            return [w.strip('.,!?;:…"«»()').lower() for w in words]
+
+        for n in range(min(len(left_words), len(right_words), self.MAX_OVERLAP_WORDS), 0, -1):
+            if normalize(left_words[-n:]) == normalize(right_words[:n]):
+                right_words = right_words[n:]
+                break
+
+        return " ".join(left_words + right_words)
+
+
 class VoiceToTextApp:
     """System tray application for voice-to-text"""
 
@@ -139,6 +338,13 @@ class VoiceToTextApp:
     LEVEL_HIGH = 15
     LEVEL_MEDIUM = 7
     LEVEL_LOW = 4
+    LEVEL_TICK_MS = 50  # Level indicator refresh period
+    _THRESHOLDS = (LEVEL_LOW, LEVEL_MEDIUM, LEVEL_HIGH)
+    _BUCKETS = ("○○○", "●○○", "●●○", "●●●")
+
+    # Groq connection pool: one multiplexed HTTP/2 connection kept warm between recordings
+    HTTP_KEEPALIVE_CONNECTIONS = 4
+    HTTP_KEEPALIVE_EXPIRY = 120.0
 
     # Status display timeouts (seconds)
     SUCCESS_TIMEOUT = 3
@@ -164,15 +370,25 @@ class VoiceToTextApp:
         self.log_file = os.path.join(self.log_dir, "transcriptions.log")
         self.prompt_file = os.path.join(self.log_dir, "prompt.txt")
 
+        # Line-buffered, so each entry reaches disk without reopening the file
+        self._log_fh = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+
         # Create default prompt file if it doesn't exist
         if not os.path.exists(self.prompt_file):
             with open(self.prompt_file, 'w', encoding='utf-8') as f:
                 f.write(f"{self.DEFAULT_PROMPT}\n")
 
+        # (mtime_ns, prompt) of the last prompt file read
+        self._prompt_cache = (0, None)
+
         print(f"[DEBUG] Transcription log: {self.log_file}")
         print(f"[DEBUG] Prompt file: {self.prompt_file}")
 
-        self.client = Groq(api_key=self.api_key)
+        # Transcription requests share one client on a dedicated event loop;
+        # the client is created there on first use (see _ensure_groq_client)
+        self.client = None
+        self._loop = asyncio.new_event_loop()
+        Thread(target=self._loop.run_forever, daemon=True).start()
         print("[DEBUG] Creating AudioRecorder...")
         self.recorder = AudioRecorder()
 
@@ -186,7 +402,12 @@ class VoiceToTextApp:
         self.is_recording = False
         self.stop_recording = Event()
         self.recording_thread = None
+        self._start_pending = False
+        self._inflight = set()  # Transcription futures not yet finished
+        self._job_ids = itertools.count(1)
         self.current_level = 0
+        self._last_bucket = None
+        self._tick_id = None
 
         # Setup signal handler for SIGUSR1
         signal.signal(signal.SIGUSR1, self._handle_signal)
@@ -232,6 +453,9 @@ class VoiceToTextApp:
         print("Voice-to-Text started")
         print(f"To toggle recording, send: kill -SIGUSR1 {os.getpid()}")
         print("You can bind this to any hotkey in your system settings")
+
+        # Import groq and open the TLS connection in the background, now that the tray is up
+        asyncio.run_coroutine_threadsafe(self._warm_up_connection(), self._loop)
     
     def update_status(self, text, icon=None):
         """Update status in menu and icon"""
@@ -239,6 +463,9 @@ class VoiceToTextApp:
     
     def _do_update_status(self, text, icon):
         """Actual status update (must run in main thread)"""
+        if text == self.status_item.get_label() and not icon:
+            return False
+
         self.status_item.set_label(text)
         if icon:
             self.indicator.set_icon(icon)
@@ -261,22 +488,22 @@ class VoiceToTextApp:
 
         return False
     
+    def level_bucket(self, level):
+        """Map audio level to its indicator based on level thresholds"""
+        # bisect_left: a level must exceed a threshold to reach the next bucket
+        return self._BUCKETS[bisect.bisect_left(self._THRESHOLDS, level)]
+
     def update_level_indicator(self, level):
-        """Update visual feedback based on audio level"""
+        """Store the latest audio level (called from recording thread)"""
         self.current_level = level
 
-        # Determine indicator based on audio level thresholds
-        if level > self.LEVEL_HIGH:
-            indicator = "●●●"
-        elif level > self.LEVEL_MEDIUM:
-            indicator = "●●○"
-        elif level > self.LEVEL_LOW:
-            indicator = "●○○"
-        else:
-            indicator = "○○○"
-
-        self.update_status(f"Recording {indicator}")
-        return False
+    def _tick_level(self):
+        """Show the latest audio level if its bucket changed (runs in main thread)"""
+        bucket = self.level_bucket(self.current_level)
+        if bucket != self._last_bucket:
+            self._last_bucket = bucket
+            self._do_update_status(f"Recording {bucket}", None)
+        return True
 
     def _handle_signal(self, _signum, _frame):
         """Handle SIGUSR1 signal to toggle recording"""
@@ -298,56 +525,125 @@ class VoiceToTextApp:
         """Start audio recording"""
         print("[DEBUG] start_recording() called")
         self.is_recording = True
+
+        # The previous recording is still finishing its file; starting now would
+        # truncate the shared rec.wav before it is handed off to its transcription.
+        # Start as soon as that thread is done instead.
+        if self.recording_thread and self.recording_thread.is_alive():
+            print("[DEBUG] Previous recording still finishing, start queued")
+            self._start_pending = True
+            self.update_status("Recording ○○○")
+            return
+
         self.stop_recording.clear()
 
         self.update_status("Recording ○○○")
         print("[DEBUG] Status updated, starting recording thread...")
 
+        # Poll the level at a fixed rate instead of on every audio chunk
+        self.current_level = 0
+        self._last_bucket = "○○○"
+        self._tick_id = GLib.timeout_add(self.LEVEL_TICK_MS, self._tick_level)
+
         # Start recording in background thread
         self.recording_thread = Thread(target=self._record_and_transcribe, daemon=True)
         self.recording_thread.start()
         print("[DEBUG] Recording thread started")
     
+    def _start_pending_recording(self):
+        """Run a start queued while the previous recording was finishing"""
+        if self._start_pending:
+            self._start_pending = False
+            # Posted as the thread's last action, so this join returns at once
+            self.recording_thread.join()
+            self.start_recording()
+        return False
+
     def stop_recording_action(self):
         """Stop audio recording"""
         if not self.is_recording:
             return
         
         self.is_recording = False
+
+        # Stopped before the queued start ran: nothing was recorded
+        if self._start_pending:
+            self._start_pending = False
+            self._reset_to_ready()
+            return
+
         self.stop_recording.set()
+
+        if self._tick_id:
+            GLib.source_remove(self._tick_id)
+            self._tick_id = None
     
     def _record_and_transcribe(self):
-        """Record audio and transcribe (runs in background thread)"""
+        """Record audio and schedule its transcription (runs in background thread)"""
+        try:
+            self._record_and_schedule()
+        finally:
+            # The shared rec.wav is free again; run a start queued meanwhile
+            GLib.idle_add(self._start_pending_recording)
+
+    def _record_and_schedule(self):
+        """Record one utterance and hand it to the event loop for transcription"""
+        # Load custom prompt for technical terms
+        custom_prompt = self._load_prompt()
+
+        # Long recordings are uploaded in windows while the user is still speaking
+        streamer = StreamingTranscriber(
+            lambda name, content: self._transcribe_audio(name, content, custom_prompt),
+            self._loop,
+            self.recorder.RATE,
+            self.recorder.SAMPLE_WIDTH,
+            self.recorder.CHANNELS,
+            self.LEVEL_LOW * self.recorder.NORMALIZATION_DIVISOR / 100
+        )
+
         # Record
-        audio_file = self.recorder.record(self.stop_recording, self.update_level_indicator)
+        audio_file = self.recorder.record(
+            self.stop_recording, self.update_level_indicator, streamer.feed
+        )
+
+        streamed = streamer.close()
 
         if not audio_file:
-            self.update_status("Ready")
+            self._reset_to_ready()
             return
 
+        # Move the recording aside so the next one can reuse rec.wav while this
+        # transcription is still running
+        job_file = f"{os.path.splitext(audio_file)[0]}-{next(self._job_ids)}.wav"
+        os.replace(audio_file, job_file)
+
         # Transcribe
-        self.update_status("Processing...")
+        if not self.is_recording:
+            self.update_status("Processing...")
+        future = asyncio.run_coroutine_threadsafe(
+            self._transcribe(job_file, streamer if streamed else None, custom_prompt),
+            self._loop
+        )
+        self._inflight.add(future)
+        future.add_done_callback(self._inflight.discard)
 
+    async def _transcribe(self, audio_file, streamer, custom_prompt):
+        """Transcribe a finished recording (runs on the event loop)"""
         try:
-            # Load custom prompt for technical terms
-            custom_prompt = self._load_prompt()
-
-            with open(audio_file, "rb") as f:
-                api_params = {
-                    "file": (audio_file, f.read()),
-                    "model": "whisper-large-v3-turbo",
-                    "language": "ru",
-                    "response_format": "text",
-                    "temperature": 0.0
-                }
-
-                # Add prompt if available
-                if custom_prompt:
-                    api_params["prompt"] = custom_prompt
-
-                transcription = self.client.audio.transcriptions.create(**api_params)
-            
-            text = transcription.strip()
+            text = None
+            if streamer:
+                try:
+                    text = await streamer.text()
+                except Exception as e:
+                    print(f"Window transcription error, sending whole file: {e}")
+
+            if text is None:
+                # Short recording or failed window: stream the whole file in one request
+                with open(audio_file, "rb") as f:
+                    transcription = await self._transcribe_audio(
+                        os.path.basename(audio_file), f, custom_prompt
+                    )
+                text = transcription.strip()
 
             if text:
                 # Save to log file (permanent storage)
@@ -358,28 +654,98 @@ class VoiceToTextApp:
 
                 # Show success
                 preview = text[:30] + "..." if len(text) > 30 else text
-                self.update_status(f"✓ Copied: {preview}")
-
-                # Reset to ready after timeout
-                GLib.timeout_add_seconds(self.SUCCESS_TIMEOUT, lambda: self._reset_to_ready())
+                self._show_result(f"✓ Copied: {preview}", self.SUCCESS_TIMEOUT)
             else:
-                self.update_status("No speech detected")
-                GLib.timeout_add_seconds(self.ERROR_TIMEOUT, lambda: self._reset_to_ready())
+                self._show_result("No speech detected", self.ERROR_TIMEOUT)
+
+        except asyncio.CancelledError:
+            print("[DEBUG] Transcription cancelled")
+            raise
 
         except Exception as e:
             print(f"Transcription error: {e}")
-            self.update_status("Error")
-            GLib.timeout_add_seconds(self.ERROR_TIMEOUT, lambda: self._reset_to_ready())
-        
+            self._show_result("Error", self.ERROR_TIMEOUT)
+
         finally:
-            # Clean up temp file
+            # Clean up this job's copy of the recording
             try:
                 os.remove(audio_file)
-            except:
+            except OSError:
                 pass
+
+    def _show_result(self, text, timeout):
+        """Show a transcription outcome, unless a newer recording owns the status"""
+        if self.is_recording:
+            return
+        self.update_status(text)
+        # Reset to ready after timeout
+        GLib.timeout_add_seconds(timeout, lambda: self._reset_to_ready())
     
+    def _ensure_groq_client(self):
+        """Create the Groq client on first use (runs on the event loop)"""
+        if self.client is None:
+            # Deferred import: groq and httpx are slow to load and unused until recording
+            from groq import AsyncGroq, DefaultAsyncHttpxClient
+            import httpx
+
+            # The SDK's client keeps its default timeouts and redirect handling
+            limits = httpx.Limits(
+                max_keepalive_connections=self.HTTP_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.HTTP_KEEPALIVE_EXPIRY
+            )
+            try:
+                http_client = DefaultAsyncHttpxClient(http2=True, limits=limits)
+            except ImportError:
+                # HTTP/2 needs the h2 package (httpx[http2]); keep-alive still applies
+                print("[DEBUG] h2 not installed, using HTTP/1.1")
+                http_client = DefaultAsyncHttpxClient(limits=limits)
+
+            self.client = AsyncGroq(api_key=self.api_key, http_client=http_client)
+        return self.client
+
+    async def _warm_up_connection(self):
+        """Establish the API connection ahead of time (runs on the event loop)"""
+        try:
+            await self._ensure_groq_client().models.list()
+            print("[DEBUG] Groq connection ready")
+        except Exception as e:
+            print(f"Connection warm-up error: {e}")
+
+    async def _transcribe_audio(self, name, content, prompt=None):
+        """Send WAV content (bytes or an open binary file) to Whisper and return the text"""
+        api_params = {
+            "file": (name, content, "audio/wav"),
+            "model": "whisper-large-v3-turbo",
+            "language": "ru",
+            "response_format": "text",
+            "temperature": 0.0
+        }
+
+        # Add prompt if available
+        if prompt:
+            api_params["prompt"] = prompt
+
+        return await self._ensure_groq_client().audio.transcriptions.create(**api_params)
+
     def _copy_to_clipboard(self, text):
         """Copy text to clipboard"""
+        GLib.idle_add(self._do_copy_to_clipboard, text)
+
+    def _do_copy_to_clipboard(self, text):
+        """Actual clipboard update (must run in main thread)"""
+        if Gdk.Display.get_default() is None:
+            # No display to own the selection: fall back to xclip
+            self._copy_with_xclip(text)
+            return False
+
+        clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
+        clipboard.set_text(text, -1)
+        # Hand the text to the clipboard manager so it survives this process
+        clipboard.store()
+        return False
+
+    def _copy_with_xclip(self, text):
+        """Copy text to clipboard via xclip"""
         try:
             process = subprocess.Popen(
                 ['xclip', '-selection', 'clipboard'],
@@ -392,25 +758,30 @@ class VoiceToTextApp:
     def _save_to_log(self, text):
         """Save transcription to log file"""
         try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"[{timestamp}] {text}\n")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._log_fh.write(f"[{timestamp}] {text}\n")
         except Exception as e:
             print(f"Log write error: {e}")
 
     def _reset_to_ready(self):
         """Reset status to ready"""
-        self.update_status("Ready")
+        if not self.is_recording:
+            self.update_status("Ready")
         return False
 
     def _load_prompt(self):
-        """Load custom prompt from file for technical terms"""
+        """Load custom prompt from file for technical terms (re-read only when modified)"""
         try:
-            if os.path.exists(self.prompt_file):
-                with open(self.prompt_file, 'r', encoding='utf-8') as f:
-                    prompt = f.read().strip()
-                    return prompt if prompt else None
+            mtime = os.stat(self.prompt_file).st_mtime_ns
+            if mtime == self._prompt_cache[0]:
+                return self._prompt_cache[1]
+
+            with open(self.prompt_file, 'r', encoding='utf-8') as f:
+                prompt = f.read().strip() or None
+            self._prompt_cache = (mtime, prompt)
+            return prompt
+        except FileNotFoundError:
+            self._prompt_cache = (0, None)
         except Exception as e:
             print(f"Prompt file read error: {e}")
         return None
@@ -418,6 +789,10 @@ class VoiceToTextApp:
     def quit(self, _=None):
         """Quit application"""
         self.recorder.cleanup()
+        for future in list(self._inflight):
+            future.cancel()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._log_fh.close()
         Gtk.main_quit()
     
     def run(self):
@@ -428,7 +803,10 @@ class VoiceToTextApp:
 
 def check_dependencies():
     """Check required system dependencies"""
-    required = ['xclip']
+    required = []
+    # xclip is only used for the clipboard when GTK has no display
+    if Gdk.Display.get_default() is None:
+        required.append('xclip')
     missing = []
 
     for cmd in required: